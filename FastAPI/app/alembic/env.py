@@ -14,7 +14,8 @@ from migrations import Base, DATABASE_URL
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
-config.set_main_option("sqlalchemy.url", DATABASE_URL)
+# Escape "%" so the URL survives the ConfigParser interpolation of the .ini values
+config.set_main_option("sqlalchemy.url", DATABASE_URL.replace("%", "%%"))
 
 
 # Interpret the config file for Python logging.
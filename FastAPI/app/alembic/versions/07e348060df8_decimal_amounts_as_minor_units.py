@@ -0,0 +1,51 @@
+"""
+This file is a database migration file, it is used to store the decimal
+amounts as BIGINT counts of minor units.
+
+The columns are:
+
+- ingredients.ingredient_calories_per_unit: thousandths
+- ingredients.ingredient_price_per_unit: cents
+- recipes_ingredients.quantity: thousandths
+- shop_list_items.item_quantity: thousandths
+- shop_list_items.item_total_price: cents
+- pantries_ingredients.pantry_ingredient_quantity: thousandths
+
+Each column is first widened so the scaled values fit, then multiplied by
+its factor and finally converted to BIGINT (the reverse on downgrade).
+"""
+
+# pylint: skip-file
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '07e348060df8'
+down_revision: Union[str, None] = 'c75ee5ee76a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCALED_COLUMNS = [
+    ('ingredients', 'ingredient_calories_per_unit', 1000),
+    ('ingredients', 'ingredient_price_per_unit', 100),
+    ('recipes_ingredients', 'quantity', 1000),
+    ('shop_list_items', 'item_quantity', 1000),
+    ('shop_list_items', 'item_total_price', 100),
+    ('pantries_ingredients', 'pantry_ingredient_quantity', 1000),
+]
+
+
+def upgrade() -> None:
+    for table, column, factor in SCALED_COLUMNS:
+        op.alter_column(table, column, existing_type=sa.DECIMAL(precision=10, scale=2), type_=sa.DECIMAL(precision=16, scale=3), existing_nullable=False)
+        op.execute(f'UPDATE {table} SET {column} = {column} * {factor}')
+        op.alter_column(table, column, existing_type=sa.DECIMAL(precision=16, scale=3), type_=sa.BigInteger(), existing_nullable=False)
+
+
+def downgrade() -> None:
+    for table, column, factor in reversed(SCALED_COLUMNS):
+        op.alter_column(table, column, existing_type=sa.BigInteger(), type_=sa.DECIMAL(precision=16, scale=3), existing_nullable=False)
+        op.execute(f'UPDATE {table} SET {column} = {column} / {factor}')
+        op.alter_column(table, column, existing_type=sa.DECIMAL(precision=16, scale=3), type_=sa.DECIMAL(precision=10, scale=2), existing_nullable=False)
@@ -0,0 +1,56 @@
+"""
+This file is a database migration file, it is used to let MySQL fill in the
+creation and update timestamps.
+
+The *_created columns get DEFAULT CURRENT_TIMESTAMP and the *_updated columns
+get DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP, in the tables:
+
+- users
+- groups
+- recipes
+- food_types
+- categories
+- menus
+- notifications
+"""
+
+# pylint: skip-file
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '1901c0a4fdd4'
+down_revision: Union[str, None] = 'a252c2496ae9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CREATED_COLUMNS = [
+    ('users', 'user_created'),
+    ('groups', 'group_created'),
+    ('recipes', 'recipe_created'),
+    ('food_types', 'food_type_created'),
+    ('categories', 'category_created'),
+    ('menus', 'menu_created'),
+    ('notifications', 'notification_created_date'),
+]
+UPDATED_COLUMNS = [
+    ('users', 'user_updated'),
+    ('groups', 'group_updated'),
+    ('recipes', 'recipe_updated'),
+    ('menus', 'menu_updated'),
+]
+
+
+def upgrade() -> None:
+    # type_ is repeated so MySQL gets a full MODIFY, which ON UPDATE requires
+    for table, column in CREATED_COLUMNS:
+        op.alter_column(table, column, existing_type=sa.DateTime(), type_=sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), existing_nullable=True)
+    for table, column in UPDATED_COLUMNS:
+        op.alter_column(table, column, existing_type=sa.DateTime(), type_=sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'), existing_nullable=True)
+
+
+def downgrade() -> None:
+    for table, column in UPDATED_COLUMNS + CREATED_COLUMNS:
+        op.alter_column(table, column, existing_type=sa.DateTime(), type_=sa.DateTime(), server_default=None, existing_nullable=True)
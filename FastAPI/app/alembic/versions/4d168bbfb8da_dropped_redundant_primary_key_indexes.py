@@ -0,0 +1,43 @@
+"""
+This file is a database migration file, it is used to drop the secondary
+indexes that duplicated the primary key of each table.
+
+InnoDB already clusters the rows by the primary key, so an extra index on
+the same column only adds a second B-tree to maintain on every insert.
+The junction tables already use composite primary keys and are untouched.
+"""
+
+# pylint: skip-file
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '4d168bbfb8da'
+down_revision: Union[str, None] = '07e348060df8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PRIMARY_KEY_INDEXES = [
+    ('categories', 'category_id'),
+    ('food_types', 'food_type_id'),
+    ('groups', 'group_id'),
+    ('measurement_units', 'unit_id'),
+    ('users', 'id'),
+    ('ingredients', 'ingredient_id'),
+    ('menus', 'menu_id'),
+    ('notifications', 'notification_id'),
+    ('recipes', 'recipe_id'),
+    ('pantries_ingredients', 'pantries_ingredients_id'),
+    ('shop_list_items', 'item_id'),
+]
+
+
+def upgrade() -> None:
+    for table, column in PRIMARY_KEY_INDEXES:
+        op.drop_index(op.f(f'ix_{table}_{column}'), table_name=table)
+
+
+def downgrade() -> None:
+    for table, column in reversed(PRIMARY_KEY_INDEXES):
+        op.create_index(op.f(f'ix_{table}_{column}'), table, [column], unique=False)
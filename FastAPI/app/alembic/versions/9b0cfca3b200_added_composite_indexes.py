@@ -0,0 +1,40 @@
+"""
+This file is a database migration file, it is used to add composite indexes
+for the per-user lookups.
+
+The indexes are:
+
+- notifications (user_id, notification_created_date)
+- pantries_ingredients (user_id, pantry_ingredient_expiration_date)
+
+MySQL drops the implicit index it created for the user_id foreign key once
+these indexes exist, so the downgrade recreates it before dropping them.
+
+The junction tables already have a composite primary key (e.g. user_id,
+group_id), and InnoDB appends the primary key to the implicit index of the
+second foreign key, so they need no extra index.
+"""
+
+# pylint: skip-file
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '9b0cfca3b200'
+down_revision: Union[str, None] = '735621c3b4e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_notifications_user_id_created', 'notifications', ['user_id', 'notification_created_date'], unique=False)
+    op.create_index('ix_pantries_ingredients_user_id_expiration', 'pantries_ingredients', ['user_id', 'pantry_ingredient_expiration_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.create_index('user_id', 'pantries_ingredients', ['user_id'], unique=False)
+    op.drop_index('ix_pantries_ingredients_user_id_expiration', table_name='pantries_ingredients')
+    op.create_index('user_id', 'notifications', ['user_id'], unique=False)
+    op.drop_index('ix_notifications_user_id_created', table_name='notifications')
@@ -0,0 +1,45 @@
+"""
+This file is a database migration file, it is used to narrow the text columns
+to the sizes their data actually needs.
+
+The columns are:
+
+- users.username: VARCHAR(100) -> VARCHAR(32)
+- users.user_pfp: VARCHAR(255) -> TEXT (never indexed)
+- groups.groups_name: VARCHAR(100) -> VARCHAR(64)
+- groups.groups_description: VARCHAR(255) -> TEXT (never indexed)
+- recipes.recipe_name: VARCHAR(100) -> VARCHAR(64)
+- ingredients.ingredient_name: VARCHAR(100) -> VARCHAR(64)
+
+Existing values longer than the new sizes must be shortened before upgrading.
+"""
+
+# pylint: skip-file
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a252c2496ae9'
+down_revision: Union[str, None] = '9b0cfca3b200'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column('users', 'username', existing_type=sa.String(length=100), type_=sa.String(length=32), existing_nullable=False)
+    op.alter_column('users', 'user_pfp', existing_type=sa.String(length=255), type_=sa.Text(), existing_nullable=True)
+    op.alter_column('groups', 'groups_name', existing_type=sa.String(length=100), type_=sa.String(length=64), existing_nullable=False)
+    op.alter_column('groups', 'groups_description', existing_type=sa.String(length=255), type_=sa.Text(), existing_nullable=True)
+    op.alter_column('recipes', 'recipe_name', existing_type=sa.String(length=100), type_=sa.String(length=64), existing_nullable=False)
+    op.alter_column('ingredients', 'ingredient_name', existing_type=sa.String(length=100), type_=sa.String(length=64), existing_nullable=False)
+
+
+def downgrade() -> None:
+    op.alter_column('ingredients', 'ingredient_name', existing_type=sa.String(length=64), type_=sa.String(length=100), existing_nullable=False)
+    op.alter_column('recipes', 'recipe_name', existing_type=sa.String(length=64), type_=sa.String(length=100), existing_nullable=False)
+    op.alter_column('groups', 'groups_description', existing_type=sa.Text(), type_=sa.String(length=255), existing_nullable=True)
+    op.alter_column('groups', 'groups_name', existing_type=sa.String(length=64), type_=sa.String(length=100), existing_nullable=False)
+    op.alter_column('users', 'user_pfp', existing_type=sa.Text(), type_=sa.String(length=255), existing_nullable=True)
+    op.alter_column('users', 'username', existing_type=sa.String(length=32), type_=sa.String(length=100), existing_nullable=False)
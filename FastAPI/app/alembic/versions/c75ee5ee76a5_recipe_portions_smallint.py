@@ -0,0 +1,25 @@
+"""
+This file is a database migration file, it is used to store the number of
+portions of a recipe as SMALLINT UNSIGNED instead of INTEGER.
+"""
+
+# pylint: skip-file
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c75ee5ee76a5'
+down_revision: Union[str, None] = '1901c0a4fdd4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column('recipes', 'recipe_portions', existing_type=sa.Integer(), type_=mysql.SMALLINT(unsigned=True), existing_nullable=False)
+
+
+def downgrade() -> None:
+    op.alter_column('recipes', 'recipe_portions', existing_type=mysql.SMALLINT(unsigned=True), type_=sa.Integer(), existing_nullable=False)
@@ -4,60 +4,188 @@ for a food recipe application.
 
 Imports:
     datetime (module): Supplies classes for manipulating dates and times.
+    decimal (module): Provides support for decimal fixed point arithmetic.
     enum (module): Provides support for enumerations.
-    peewee (module): An ORM (Object Relational Mapping) library for Python.
+    sqlalchemy (module): An ORM (Object Relational Mapping) library for Python,
+    used here through its asyncio extension.
+    fastapi (module): Supplies the Request read by the session dependency.
     app.config.settings (module): Contains the database configuration settings.
 
+Attributes:
+    BULK_CREATE_CHUNK_SIZE (int): Rows per INSERT statement of BulkCreateMixin.bulk_create.
+
 Classes:
     RoleEnum (Enum): Enumeration for user roles.
     DifficultyEnum (Enum): Enumeration for difficulty levels.
     UnitTypeEnum (Enum): Enumeration for unit types.
     MenuTypeEnum (Enum): Enumeration for menu types.
     NotificationTypeEnum (Enum): Enumeration for notification types.
-    UserModel (Model): Represents a user in the database.
-    GroupModel (Model): Represents a group in the database.
-    UserGroupModel (Model): Represents the relationship between users and groups.
-    RecipeModel (Model): Represents a recipe in the database.
-    FoodTypeModel (Model): Represents a food type in the database.
-    RecipeFoodTypeModel (Model): Represents the relationship between recipes and food types.
-    CategoryModel (Model): Represents a category in the database.
-    IngredientModel (Model): Represents an ingredient in the database.
-    MeasurementUnitModel (Model): Represents a measurement unit in the database.
-    RecipeIngredientModel (Model): Represents the relationship between recipes and ingredients.
-    MenuModel (Model): Represents a menu in the database.
-    MenuRecipeModel (Model): Represents the relationship between menus and recipes.
-    MenuGroupModel (Model): Represents the relationship between menus and groups.
-    ShopListItemModel (Model): Represents a shopping list item in the database.
-    PantriesIngredientModel (Model): Represents the relationship between pantries and ingredients.
-    NotificationModel (Model): Represents a notification in the database.
+    ScaledInteger (TypeDecorator): Stores a decimal amount as an integer of minor units.
+    Base (DeclarativeBase): Base class for all the database models.
+    BulkCreateMixin: Adds batched multi-row inserts to the write-heavy models.
+    UserModel (Base): Represents a user in the database.
+    GroupModel (Base): Represents a group in the database.
+    UserGroupModel (Base): Represents the relationship between users and groups.
+    RecipeModel (Base): Represents a recipe in the database.
+    FoodTypeModel (Base): Represents a food type in the database.
+    RecipeFoodTypeModel (Base): Represents the relationship between recipes and food types.
+    CategoryModel (Base): Represents a category in the database.
+    IngredientModel (Base): Represents an ingredient in the database.
+    MeasurementUnitModel (Base): Represents a measurement unit in the database.
+    RecipeIngredientModel (Base): Represents the relationship between recipes and ingredients.
+    MenuModel (Base): Represents a menu in the database.
+    MenuRecipeModel (Base): Represents the relationship between menus and recipes.
+    MenuGroupModel (Base): Represents the relationship between menus and groups.
+    ShopListItemModel (Base): Represents a shopping list item in the database.
+    PantriesIngredientModel (Base): Represents the relationship between pantries and ingredients.
+    NotificationModel (Base): Represents a notification in the database.
+
+Functions:
+    get_session(): FastAPI dependency that yields an asynchronous database session.
+    database_url(): Builds the URL of the MySQL database for a driver.
+    build_engine(): Creates the engine connected to the MySQL database.
+    build_session_factory(): Creates the session factory bound to an engine.
 """
 
 # pylint: disable=too-few-public-methods
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
 from enum import Enum
-from peewee import (
-    Model,
-    AutoField,
-    CharField,
-    DateTimeField,
-    ForeignKeyField,
-    IntegerField,
-    TextField,
-    BooleanField,
-    DateField,
-    DecimalField,
-    TimeField,
-    MySQLDatabase,
+from sqlalchemy import (
+    URL,
+    BigInteger,
+    Enum as SQLEnum,
+    FetchedValue,
+    ForeignKey,
+    Index,
+    Select,
+    String,
+    Text,
+    TypeDecorator,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.dialects.mysql import SMALLINT
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
 )
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from fastapi import Request
 from config.settings import DATABASE
 
-database = MySQLDatabase(
-    DATABASE["name"],
-    user=DATABASE["user"],
-    passwd=DATABASE["password"],
-    host=DATABASE["host"],
-    port=DATABASE["port"],
-)
+__all__ = [
+    "get_session",
+    "database_url",
+    "build_engine",
+    "build_session_factory",
+    "RoleEnum",
+    "DifficultyEnum",
+    "UnitTypeEnum",
+    "MenuTypeEnum",
+    "NotificationTypeEnum",
+    "Base",
+    "BulkCreateMixin",
+    "UserModel",
+    "GroupModel",
+    "UserGroupModel",
+    "RecipeModel",
+    "FoodTypeModel",
+    "RecipeFoodTypeModel",
+    "CategoryModel",
+    "IngredientModel",
+    "MeasurementUnitModel",
+    "RecipeIngredientModel",
+    "MenuModel",
+    "MenuRecipeModel",
+    "MenuGroupModel",
+    "ShopListItemModel",
+    "PantriesIngredientModel",
+    "NotificationModel",
+]
+
+# Timestamps are filled in by MySQL, so inserts and updates don't have to
+# build and bind a datetime for them.
+_CURRENT_TIMESTAMP = text("CURRENT_TIMESTAMP")
+_CURRENT_TIMESTAMP_ON_UPDATE = text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP")
+
+
+async def get_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """
+    Yield a database session for the duration of a request.
+
+    Args:
+        request (Request): The current request, whose app holds the session factory.
+
+    Yields:
+        AsyncSession: The session, closed once the request is finished.
+    """
+    async with request.app.state.session_factory() as session:
+        yield session
+
+
+def database_url(drivername: str) -> URL:
+    """
+    Build the URL of the MySQL database for a driver.
+
+    The engine and Alembic connect through different drivers, so this is the
+    one place where the credentials become a URL; URL.create escapes them.
+
+    Args:
+        drivername (str): The dialect and driver, e.g. "mysql+asyncmy".
+
+    Returns:
+        URL: The connection URL.
+    """
+    return URL.create(
+        drivername,
+        username=DATABASE["user"],
+        password=DATABASE["password"],
+        host=DATABASE["host"],
+        port=DATABASE["port"],
+        database=DATABASE["name"],
+    )
+
+
+def build_engine() -> AsyncEngine:
+    """
+    Create an engine connected to the MySQL database.
+
+    The application lifespan calls it in every worker process, so each one
+    builds its own pool after the fork instead of inheriting one made at
+    import time; importing the models alone never touches the driver.
+
+    Returns:
+        AsyncEngine: The engine with its connection pool.
+    """
+    return create_async_engine(
+        database_url(DATABASE["engine"]),
+        pool_size=DATABASE["pool_size"],
+        max_overflow=DATABASE["max_overflow"],
+        pool_timeout=DATABASE["pool_timeout"],
+        pool_recycle=DATABASE["pool_recycle"],
+        pool_pre_ping=True,
+        echo=DATABASE["echo"],
+        echo_pool=DATABASE["echo_pool"],
+    )
+
+
+def build_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """
+    Create the factory of the sessions bound to an engine.
+
+    Args:
+        engine (AsyncEngine): The engine the sessions connect through.
+
+    Returns:
+        async_sessionmaker: The factory for the asynchronous database sessions.
+    """
+    return async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
 
 class RoleEnum(Enum):
     """
@@ -134,11 +262,140 @@ class NotificationTypeEnum(Enum):
     PRODUCT_EXPIRATION = "Product Expiration"
 
 
+def _enum_values(enum_cls: type[Enum]) -> list[str]:
+    """
+    Get the values stored in the database for an enumeration.
+
+    The native MySQL ENUM columns hold the member values (e.g. "admin"),
+    while the models load and accept the members themselves.
+
+    Args:
+        enum_cls (type[Enum]): The enumeration class.
+
+    Returns:
+        List: The values of the enumeration members.
+    """
+    return [member.value for member in enum_cls]
+
+
+# Column types built once at import: each one keeps the value <-> member
+# lookup tables SQLAlchemy derives from the enumeration, and validate_strings
+# rejects unknown values on the client instead of sending them to MySQL.
+_ROLE_TYPE = SQLEnum(RoleEnum, values_callable=_enum_values, validate_strings=True)
+_DIFFICULTY_TYPE = SQLEnum(DifficultyEnum, values_callable=_enum_values, validate_strings=True)
+_UNIT_TYPE = SQLEnum(UnitTypeEnum, values_callable=_enum_values, validate_strings=True)
+_MENU_TYPE = SQLEnum(MenuTypeEnum, values_callable=_enum_values, validate_strings=True)
+_NOTIFICATION_TYPE = SQLEnum(
+    NotificationTypeEnum, values_callable=_enum_values, validate_strings=True
+)
+
+
+class ScaledInteger(TypeDecorator):  # pylint: disable=too-many-ancestors
+    """
+    Stores a decimal amount as a BIGINT count of minor units (e.g. cents).
+
+    Sums and comparisons then run as integer arithmetic in MySQL, while the
+    models keep loading and accepting Decimal values.
+
+    Attributes:
+        decimal_places (int): Number of decimal places kept for the amount.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def __init__(self, decimal_places: int):
+        super().__init__()
+        self.decimal_places = decimal_places
+
+    def process_bind_param(self, value, dialect):
+        """
+        Convert a decimal amount to its integer number of minor units.
+        """
+        if value is None:
+            return None
+        minor_units = Decimal(str(value)).scaleb(self.decimal_places)
+        return int(minor_units.to_integral_value(rounding=ROUND_HALF_UP))
+
+    def process_literal_param(self, value, dialect):
+        """
+        Render a decimal amount as an integer literal of minor units.
+        """
+        minor_units = self.process_bind_param(value, dialect)
+        return "NULL" if minor_units is None else str(minor_units)
+
+    def process_result_value(self, value, dialect):
+        """
+        Convert a stored number of minor units back to a decimal amount.
+        """
+        if value is None:
+            return None
+        return Decimal(value).scaleb(-self.decimal_places)
+
+    @property
+    def python_type(self):
+        """
+        The Python type of the values handled by the column.
+        """
+        return Decimal
+
+
+class Base(DeclarativeBase):
+    """
+    Base class for all the database models.
+    """
+
+    # The timestamps are generated by MySQL, which has no RETURNING, so the ORM
+    # would expire them after each flush and try a lazy refresh on the next
+    # read, which an async session cannot run; eager_defaults fetches them
+    # within the flush instead.
+    __mapper_args__ = {"eager_defaults": True}
+
+    @classmethod
+    def select_rows(cls) -> Select:
+        """
+        Build a SELECT of every column of the model that returns plain rows.
+
+        Scans that only read the data should use it instead of select(Model):
+        the rows are tuples, with no per-row instance __dict__, attribute
+        state or identity map entry to allocate.
+
+        Returns:
+            Select: The statement, to be completed with where/order_by clauses.
+        """
+        return select(*cls.__table__.columns)
+
+
+
+# Rows per INSERT statement, which keeps each batch well under MySQL's
+# max_allowed_packet.
+BULK_CREATE_CHUNK_SIZE = 1000
+
+
+class BulkCreateMixin:
+    """
+    Adds batched multi-row inserts to a model.
+    """
+
+    @classmethod
+    async def bulk_create(cls, session: AsyncSession, rows: Sequence[dict]) -> None:
+        """
+        Insert many rows with one INSERT ... VALUES statement per chunk.
+
+        The rows are not loaded into the session; the caller commits.
+
+        Args:
+            session (AsyncSession): The database session.
+            rows (Sequence[dict]): The column values of each row to insert.
+        """
+        for start in range(0, len(rows), BULK_CREATE_CHUNK_SIZE):
+            await session.execute(insert(cls), rows[start:start + BULK_CREATE_CHUNK_SIZE])
+
 
-class UserModel(Model):
+class UserModel(Base):
     """
     UserModel class representing a user entity.
-    
+
     Attributes:
         id (int): Unique identifier for the user.
         username (str): The user's username.
@@ -147,184 +404,177 @@ class UserModel(Model):
         user_pfp (str): The user's profile picture.
         user_created (datetime): The date and time the user was created.
         user_updated (datetime): The date and time the user was last updated
-    """
-    id = AutoField(primary_key=True)
-    username = CharField(max_length=100)
-    user_email = CharField(max_length=100, unique=True)
-    user_password = CharField(max_length=255)
-    user_pfp = CharField(max_length=255, null=True)
-    user_created = DateTimeField(default=datetime.now)
-    user_updated = DateTimeField(default=datetime.now)
+        recipes (list[RecipeModel]): The recipes created by the user.
+        menus (list[MenuModel]): The menus created by the user.
+        notifications (list[NotificationModel]): The notifications sent to the user.
+        pantry_items (list[PantriesIngredientModel]): The ingredients in the user's pantry.
+        group_links (list[UserGroupModel]): The groups the user belongs to.
+
+    The collections load with "selectin": listing N users with them costs one
+    extra "WHERE user_id IN (...)" query per collection instead of N; queries
+    that don't need them can skip them with noload().
+    """
+
+    __tablename__ = "users"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    username: Mapped[str] = mapped_column(String(32), unique=True, index=True)
+    user_email: Mapped[str] = mapped_column(String(100), unique=True)
+    user_password: Mapped[str] = mapped_column(String(255))
+    user_pfp: Mapped[str | None] = mapped_column(Text)
+    user_created: Mapped[datetime | None] = mapped_column(server_default=_CURRENT_TIMESTAMP)
+    user_updated: Mapped[datetime | None] = mapped_column(
+        server_default=_CURRENT_TIMESTAMP_ON_UPDATE, server_onupdate=FetchedValue()
+    )
 
-    class Meta:
-        """
-        Meta class for the UserModel.
-        
-        Attributes:
-        
-            database (MySQLDatabase): The database to connect to.
-            table_name (str): The name of the table in the database.
-        """
-        database = database
-        table_name = "users"
+    recipes: Mapped[list["RecipeModel"]] = relationship(back_populates="user", lazy="selectin")
+    menus: Mapped[list["MenuModel"]] = relationship(back_populates="user", lazy="selectin")
+    notifications: Mapped[list["NotificationModel"]] = relationship(
+        back_populates="user", lazy="selectin"
+    )
+    pantry_items: Mapped[list["PantriesIngredientModel"]] = relationship(
+        back_populates="user", lazy="selectin"
+    )
+    group_links: Mapped[list["UserGroupModel"]] = relationship(
+        back_populates="user", lazy="selectin"
+    )
 
-class GroupModel(Model):
+
+class GroupModel(Base):
     """
     Represents a group in the database.
 
     Attributes:
-        group_id (AutoField): The primary key for the group.
-        groups_name (CharField): The name of the group, with a maximum length of 100 characters.
-        groups_description (CharField): The description of the group,
-        with a maximum length of 255 characters.
+        group_id (int): The primary key for the group.
+        groups_name (str): The name of the group, with a maximum length of 64 characters.
+        groups_description (str): The description of the group.
         This field is optional.
-        group_created (DateTimeField): The timestamp when the group was created.
+        group_created (datetime): The timestamp when the group was created.
         Defaults to the current date and time.
-        group_updated (DateTimeField): The timestamp when the group was last updated.
+        group_updated (datetime): The timestamp when the group was last updated.
         Defaults to the current date and time.
     """
 
-    group_id = AutoField(primary_key=True)
-    groups_name = CharField(max_length=100)
-    groups_description = CharField(max_length=255, null=True)
-    group_created = DateTimeField(default=datetime.now)
-    group_updated = DateTimeField(default=datetime.now)
-
-    class Meta:
-        """
-        Meta:
-        table_name (str): The name of the database table for this model.
-        """
-        database = database
-        table_name = "groups"
+    __tablename__ = "groups"
+    group_id: Mapped[int] = mapped_column(primary_key=True)
+    groups_name: Mapped[str] = mapped_column(String(64))
+    groups_description: Mapped[str | None] = mapped_column(Text)
+    group_created: Mapped[datetime | None] = mapped_column(server_default=_CURRENT_TIMESTAMP)
+    group_updated: Mapped[datetime | None] = mapped_column(
+        server_default=_CURRENT_TIMESTAMP_ON_UPDATE, server_onupdate=FetchedValue()
+    )
 
 
-class UserGroupModel(Model):
+class UserGroupModel(Base):
     """
     Represents the relationship between users and groups in the database.
 
     Attributes:
-        user_id (ForeignKeyField): A foreign key to the UserModel, representing the user.
-        group_id (ForeignKeyField): A foreign key to the GroupModel, representing the group.
-        rol (CharField): The role of the user within the group, with choices defined by RoleEnum.
+        user_id (int): A foreign key to the UserModel, representing the user.
+        group_id (int): A foreign key to the GroupModel, representing the group.
+        rol (RoleEnum): The role of the user within the group.
+        user (UserModel): The related user.
 
-    Meta:
-        table_name (str): The name of the database table for this model.
-        primary_key (bool): Indicates that this model does not have a single primary key.
+    The primary key is composed of user_id and group_id.
     """
 
-    user_id = ForeignKeyField(UserModel, backref="user_groups", on_delete="CASCADE")
-    group_id = ForeignKeyField(GroupModel, backref="group_users", on_delete="CASCADE")
-    rol = CharField(choices=[(role.value, role.name) for role in RoleEnum])
-
-    class Meta:
-        """
-        Meta:
-        table_name (str): The name of the database table for this model.
-        primary_key (bool): Indicates that this model does not have a single primary key.
-        """
+    __tablename__ = "user_groups"
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    group_id: Mapped[int] = mapped_column(ForeignKey("groups.group_id"), primary_key=True)
+    rol: Mapped[RoleEnum] = mapped_column(_ROLE_TYPE)
 
-        database = database
-        table_name = "user_groups"
-        primary_key = False
+    user: Mapped[UserModel] = relationship(back_populates="group_links")
 
 
-class RecipeModel(Model):
+class RecipeModel(Base):
     """
     Represents a recipe in the database.
 
     Attributes:
-        recipe_id (AutoField): The primary key for the recipe.
-        user_id (ForeignKeyField): A foreign key to the UserModel,
+        recipe_id (int): The primary key for the recipe.
+        user_id (int): A foreign key to the UserModel,
         representing the user who created the recipe.
-        recipe_name (CharField): The name of the recipe, with a maximum length of 100 characters.
-        recipe_description (TextField): A detailed description of the recipe.
-        recipe_prepare_time (IntegerField): The preparation time for the recipe, in minutes.
-        recipe_difficulty (CharField): The difficulty level of the recipe,
-        with choices defined by DifficultyEnum.
-        recipe_portions (TimeField): The number of portions the recipe yields.
-        recipe_instructions (TextField): The instructions for preparing the recipe.
+        recipe_name (str): The name of the recipe, with a maximum length of 64 characters.
+        recipe_description (str): A detailed description of the recipe.
+        recipe_prepare_time (int): The preparation time for the recipe, in minutes.
+        recipe_difficulty (DifficultyEnum): The difficulty level of the recipe.
+        recipe_portions (int): The number of portions the recipe yields.
+        recipe_instructions (str): The instructions for preparing the recipe.
         This field is optional.
-        recipe_is_public (BooleanField): Indicates whether the recipe is public. Defaults to False.
-        recipe_created (DateTimeField): The timestamp when the recipe was created.
+        recipe_is_public (bool): Indicates whether the recipe is public. Defaults to False.
+        recipe_created (datetime): The timestamp when the recipe was created.
         Defaults to the current date and time.
-        recipe_updated (DateTimeField): The timestamp when the recipe was last updated.
+        recipe_updated (datetime): The timestamp when the recipe was last updated.
         Defaults to the current date and time.
-    """
-
-    recipe_id = AutoField(primary_key=True)
-    user_id = ForeignKeyField(UserModel, backref="recipes", on_delete="CASCADE")
-    recipe_name = CharField(max_length=100)
-    recipe_description = TextField()
-    recipe_prepare_time = IntegerField()
-    recipe_difficulty = CharField(
-        choices=[(difficulty.value, difficulty.name) for difficulty in DifficultyEnum]
+        food_types (list[RecipeFoodTypeModel]): The food types of the recipe.
+        ingredients (list[RecipeIngredientModel]): The ingredients used by the recipe.
+        menus (list[MenuRecipeModel]): The menus that include the recipe.
+        user (UserModel): The user who created the recipe.
+    """
+
+    __tablename__ = "recipes"
+    recipe_id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    recipe_name: Mapped[str] = mapped_column(String(64))
+    recipe_description: Mapped[str] = mapped_column(Text)
+    recipe_prepare_time: Mapped[int]
+    recipe_difficulty: Mapped[DifficultyEnum] = mapped_column(_DIFFICULTY_TYPE)
+    recipe_portions: Mapped[int] = mapped_column(SMALLINT(unsigned=True))
+    recipe_instructions: Mapped[str | None] = mapped_column(Text)
+    recipe_is_public: Mapped[bool] = mapped_column(default=False)
+    recipe_created: Mapped[datetime | None] = mapped_column(server_default=_CURRENT_TIMESTAMP)
+    recipe_updated: Mapped[datetime | None] = mapped_column(
+        server_default=_CURRENT_TIMESTAMP_ON_UPDATE, server_onupdate=FetchedValue()
     )
-    recipe_portions = TimeField()
-    recipe_instructions = TextField(null=True)
-    recipe_is_public = BooleanField(default=False)
-    recipe_created = DateTimeField(default=datetime.now)
-    recipe_updated = DateTimeField(default=datetime.now)
 
-    class Meta:
-        """
-        Meta:
-        table_name (str): The name of the database table for this model.
-        """
-        database = database
-        table_name = "recipes"
+    food_types: Mapped[list["RecipeFoodTypeModel"]] = relationship(back_populates="recipe")
+    ingredients: Mapped[list["RecipeIngredientModel"]] = relationship(back_populates="recipe")
+    menus: Mapped[list["MenuRecipeModel"]] = relationship(back_populates="recipe")
+    user: Mapped[UserModel] = relationship(back_populates="recipes")
 
 
-class FoodTypeModel(Model):
+class FoodTypeModel(Base):
     """
     FoodTypeModel is a model class representing the 'food_types' table in the database.
     Attributes:
-        food_type_id (AutoField): The primary key for the food type.
-        food_type_name (CharField): The name of the food type, with a maximum length of 50 character
-        food_type_created (DateTimeField): The timestamp when the food type was created,
+        food_type_id (int): The primary key for the food type.
+        food_type_name (str): The name of the food type, with a maximum length of 50 character
+        food_type_created (datetime): The timestamp when the food type was created,
         defaults to the current datetime.
+        recipes (list[RecipeFoodTypeModel]): The recipes of this food type.
     """
 
-    food_type_id = AutoField(primary_key=True)
-    food_type_name = CharField(max_length=50)
-    food_type_created = DateTimeField(default=datetime.now)
+    __tablename__ = "food_types"
+    food_type_id: Mapped[int] = mapped_column(primary_key=True)
+    food_type_name: Mapped[str] = mapped_column(String(50))
+    food_type_created: Mapped[datetime | None] = mapped_column(server_default=_CURRENT_TIMESTAMP)
 
-    class Meta:
-        """
-        Meta:
-        table_name (str): The name of the table in the database.
-        """
-        database = database
-        table_name = "food_types"
+    recipes: Mapped[list["RecipeFoodTypeModel"]] = relationship(back_populates="food_type")
 
 
-class RecipeFoodTypeModel(Model):
+class RecipeFoodTypeModel(Base):
     """
     Represents the many-to-many relationship between recipes and food types.
 
     Attributes:
         recipe_id (int): Foreign key referencing a specific recipe.
         food_type_id (int): Foreign key referencing a specific food type.
+        recipe (RecipeModel): The related recipe.
+        food_type (FoodTypeModel): The related food type.
 
+    The primary key is composed of recipe_id and food_type_id.
     """
 
-    recipe_id = ForeignKeyField(RecipeModel, backref="food_types", on_delete="CASCADE")
-    food_type_id = ForeignKeyField(
-        FoodTypeModel, backref="recipes", on_delete="CASCADE"
+    __tablename__ = "recipes_food_types"
+    recipe_id: Mapped[int] = mapped_column(ForeignKey("recipes.recipe_id"), primary_key=True)
+    food_type_id: Mapped[int] = mapped_column(
+        ForeignKey("food_types.food_type_id"), primary_key=True
     )
 
-    class Meta:
-        """
-        Meta:
-        table_name (str): Name of the database table ("recipes_food_types").
-        primary_key (bool): No single primary key, using a composite key instead.
-        """
-        database = database
-        table_name = "recipes_food_types"
-        primary_key = False
+    recipe: Mapped[RecipeModel] = relationship(back_populates="food_types")
+    food_type: Mapped[FoodTypeModel] = relationship(back_populates="recipes")
 
 
-class CategoryModel(Model):
+class CategoryModel(Base):
     """
     Represents a category that groups related ingredients.
 
@@ -336,57 +586,44 @@ class CategoryModel(Model):
 
     """
 
-    category_id = AutoField(primary_key=True)
-    category_name = CharField(max_length=50)
-    category_created = DateTimeField(default=datetime.now)
+    __tablename__ = "categories"
+    category_id: Mapped[int] = mapped_column(primary_key=True)
+    category_name: Mapped[str] = mapped_column(String(50))
+    category_created: Mapped[datetime | None] = mapped_column(server_default=_CURRENT_TIMESTAMP)
 
-    class Meta:
-        """
-        Meta:
-        table_name (str): Name of the database table ("categories").
-        """
-        database = database
-        table_name = "categories"
 
-
-class IngredientModel(Model):
+class IngredientModel(Base):
     """
     Represents an ingredient used in recipes.
 
     Attributes:
         ingredient_id (int): Primary key for the ingredient.
         ingredient_name (str): Name of the ingredient (e.g., "Tomato").
-        ingredient_calories_per_unit (float): Caloric value per unit of the ingredient.
-        ingredient_price_per_unit (float): Price per unit of the ingredient.
-        ingredient_created_date (date): Date when the ingredient record was created.
-        ingredient_expiration_date (date): Expiration date of the ingredient.
+        ingredient_calories_per_unit (decimal): Caloric value per unit of the ingredient.
+        ingredient_price_per_unit (decimal): Price per unit of the ingredient.
+        ingredient_created_date (datetime): Date when the ingredient record was created.
+        ingredient_expiration_date (datetime): Expiration date of the ingredient.
         ingredient_description (str): Additional details or notes about the ingredient.
         category_id (int): Foreign key referencing the category to which the ingredient belongs.
+        recipes (list[RecipeIngredientModel]): The recipes that use the ingredient.
 
 
     """
 
-    ingredient_id = AutoField(primary_key=True)
-    ingredient_name = CharField(max_length=100)
-    ingredient_calories_per_unit = DecimalField(max_digits=10, decimal_places=2)
-    ingredient_price_per_unit = DecimalField(max_digits=10, decimal_places=2)
-    ingredient_created_date = DateField()
-    ingredient_expiration_date = DateField()
-    ingredient_description = TextField()
-    category_id = ForeignKeyField(
-        CategoryModel, backref="ingredients", on_delete="CASCADE"
-    )
+    __tablename__ = "ingredients"
+    ingredient_id: Mapped[int] = mapped_column(primary_key=True)
+    ingredient_name: Mapped[str] = mapped_column(String(64))
+    ingredient_calories_per_unit: Mapped[Decimal] = mapped_column(ScaledInteger(3))
+    ingredient_price_per_unit: Mapped[Decimal] = mapped_column(ScaledInteger(2))
+    ingredient_created_date: Mapped[datetime]
+    ingredient_expiration_date: Mapped[datetime]
+    ingredient_description: Mapped[str] = mapped_column(Text)
+    category_id: Mapped[int] = mapped_column(ForeignKey("categories.category_id"))
 
-    class Meta:
-        """
-        Meta:
-        table_name (str): Name of the database table ("ingredients").
-        """
-        database = database
-        table_name = "ingredients"
+    recipes: Mapped[list["RecipeIngredientModel"]] = relationship(back_populates="ingredient")
 
 
-class MeasurementUnitModel(Model):
+class MeasurementUnitModel(Base):
     """
     Represents a measurement unit used for ingredients, such as mass, volume, or units.
 
@@ -394,59 +631,56 @@ class MeasurementUnitModel(Model):
         unit_id (int): Primary key for the measurement unit.
         unit_name (str): Full name of the measurement unit (e.g., "Kilogram").
         unit_abbreviation (str): Abbreviation of the unit (e.g., "kg").
-        unit_type (str): Type of the unit, restricted to 'mass', 'volume', or 'unit'.
+        unit_type (UnitTypeEnum): Type of the unit, restricted to 'mass', 'volume', or 'unit'.
+        recipe_ingredients (list[RecipeIngredientModel]): The recipe ingredients measured
+        with this unit.
 
 
     """
 
-    unit_id = AutoField(primary_key=True)
-    unit_name = CharField(max_length=50)
-    unit_abbreviation = CharField(max_length=10)
-    unit_type = CharField(choices=[(unit.value, unit.name) for unit in UnitTypeEnum])
+    __tablename__ = "measurement_units"
+    unit_id: Mapped[int] = mapped_column(primary_key=True)
+    unit_name: Mapped[str] = mapped_column(String(50))
+    unit_abbreviation: Mapped[str] = mapped_column(String(10))
+    unit_type: Mapped[UnitTypeEnum] = mapped_column(_UNIT_TYPE)
 
-    class Meta:
-        """
-         Meta:
-        table_name (str): The name of the table in the database ("measurement_units").
-        """
-        database = database
-        table_name = "measurement_units"
+    recipe_ingredients: Mapped[list["RecipeIngredientModel"]] = relationship(
+        back_populates="measurement_unit"
+    )
 
 
-class RecipeIngredientModel(Model):
+class RecipeIngredientModel(BulkCreateMixin, Base):
     """
     Represents the relationship between recipes and ingredients.
 
     Attributes:
         recipe_id (int): Foreign key to the recipe.
         ingredient_id (int): Foreign key to the ingredient.
-        quantity (float): Quantity of the ingredient used in the recipe.
+        quantity (decimal): Quantity of the ingredient used in the recipe.
         measurement_unit_id (int): Foreign key to the measurement unit used for the quantity.
+        recipe (RecipeModel): The related recipe.
+        ingredient (IngredientModel): The related ingredient.
+        measurement_unit (MeasurementUnitModel): The related measurement unit.
 
-
+    The primary key is composed of recipe_id and ingredient_id.
     """
 
-    recipe_id = ForeignKeyField(RecipeModel, backref="ingredients", on_delete="CASCADE")
-    ingredient_id = ForeignKeyField(
-        IngredientModel, backref="recipes", on_delete="CASCADE"
-    )
-    quantity = DecimalField(max_digits=10, decimal_places=2)
-    measurement_unit_id = ForeignKeyField(
-        MeasurementUnitModel, backref="recipe_ingredients", on_delete="CASCADE"
+    __tablename__ = "recipes_ingredients"
+    recipe_id: Mapped[int] = mapped_column(ForeignKey("recipes.recipe_id"), primary_key=True)
+    ingredient_id: Mapped[int] = mapped_column(
+        ForeignKey("ingredients.ingredient_id"), primary_key=True
     )
+    quantity: Mapped[Decimal] = mapped_column(ScaledInteger(3))
+    measurement_unit_id: Mapped[int] = mapped_column(ForeignKey("measurement_units.unit_id"))
 
-    class Meta:
-        """
-        Meta:
-        table_name (str): The name of the table ("recipes_ingredients").
-        primary_key (bool): This table does not use a single primary key, but rather a composite key
-        """
-        database = database
-        table_name = "recipes_ingredients"
-        primary_key = False
+    recipe: Mapped[RecipeModel] = relationship(back_populates="ingredients")
+    ingredient: Mapped[IngredientModel] = relationship(back_populates="recipes")
+    measurement_unit: Mapped[MeasurementUnitModel] = relationship(
+        back_populates="recipe_ingredients"
+    )
 
 
-class MenuModel(Model):
+class MenuModel(Base):
     """
     Represents a menu created by a user, containing various recipes.
 
@@ -455,52 +689,48 @@ class MenuModel(Model):
         user_id (int): Foreign key to the user who created the menu.
         menu_created (datetime): Timestamp of when the menu was created.
         menu_updated (datetime): Timestamp of the last update.
-        menu_type (str): Type of the menu (e.g., 'Breakfast', 'Lunch', etc.).
+        menu_type (MenuTypeEnum): Type of the menu (e.g., 'Breakfast', 'Lunch', etc.).
+        recipes (list[MenuRecipeModel]): The recipes included in the menu.
+        user (UserModel): The user who created the menu.
 
 
     """
 
-    menu_id = AutoField(primary_key=True)
-    user_id = ForeignKeyField(UserModel, backref="menus", on_delete="CASCADE")
-    menu_created = DateTimeField(default=datetime.now)
-    menu_updated = DateTimeField(default=datetime.now)
-    menu_type = CharField(choices=[(menu.value, menu.name) for menu in MenuTypeEnum])
+    __tablename__ = "menus"
+    menu_id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    menu_created: Mapped[datetime | None] = mapped_column(server_default=_CURRENT_TIMESTAMP)
+    menu_updated: Mapped[datetime | None] = mapped_column(
+        server_default=_CURRENT_TIMESTAMP_ON_UPDATE, server_onupdate=FetchedValue()
+    )
+    menu_type: Mapped[MenuTypeEnum] = mapped_column(_MENU_TYPE)
 
-    class Meta:
-        """
-        Meta:
-        table_name (str): The name of the table ("menus").
-        """
-        database = database
-        table_name = "menus"
+    recipes: Mapped[list["MenuRecipeModel"]] = relationship(back_populates="menu")
+    user: Mapped[UserModel] = relationship(back_populates="menus")
 
 
-class MenuRecipeModel(Model):
+class MenuRecipeModel(BulkCreateMixin, Base):
     """
     Represents the relationship between menus and recipes.
 
     Attributes:
         menu_id (int): Foreign key to the menu.
         recipe_id (int): Foreign key to the recipe.
+        menu (MenuModel): The related menu.
+        recipe (RecipeModel): The related recipe.
 
-
+    The primary key is composed of menu_id and recipe_id.
     """
 
-    menu_id = ForeignKeyField(MenuModel, backref="recipes", on_delete="CASCADE")
-    recipe_id = ForeignKeyField(RecipeModel, backref="menus", on_delete="CASCADE")
+    __tablename__ = "menus_recipes"
+    menu_id: Mapped[int] = mapped_column(ForeignKey("menus.menu_id"), primary_key=True)
+    recipe_id: Mapped[int] = mapped_column(ForeignKey("recipes.recipe_id"), primary_key=True)
 
-    class Meta:
-        """
-        Meta:
-        table_name (str): The name of the table ("menus_recipes").
-        primary_key (bool): This table does not use a single primary key but a composite key.
-        """
-        database = database
-        table_name = "menus_recipes"
-        primary_key = False
+    menu: Mapped[MenuModel] = relationship(back_populates="recipes")
+    recipe: Mapped[RecipeModel] = relationship(back_populates="menus")
 
 
-class MenuGroupModel(Model):
+class MenuGroupModel(Base):
     """
     Represents the relationship between menus and groups.
 
@@ -508,86 +738,68 @@ class MenuGroupModel(Model):
         menu_id (int): Foreign key to the menu.
         group_id (int): Foreign key to the group.
 
-
+    The primary key is composed of menu_id and group_id.
     """
 
-    menu_id = ForeignKeyField(MenuModel, backref="groups", on_delete="CASCADE")
-    group_id = ForeignKeyField(GroupModel, backref="menus", on_delete="CASCADE")
-
-    class Meta:
-        """
-        Meta:
-        table_name (str): The name of the table ("menus_groups").
-        primary_key (bool): This table does not use a single primary key but a composite key.
-        """
-        database = database
-        table_name = "menus_groups"
-        primary_key = False
+    __tablename__ = "menus_groups"
+    menu_id: Mapped[int] = mapped_column(ForeignKey("menus.menu_id"), primary_key=True)
+    group_id: Mapped[int] = mapped_column(ForeignKey("groups.group_id"), primary_key=True)
 
 
-class ShopListItemModel(Model):
+class ShopListItemModel(BulkCreateMixin, Base):
     """
     Represents an item in a shopping list.
 
     Attributes:
         item_id (int): Primary key for the shopping list item.
         item_ingredient_id (int): Foreign key to the ingredient.
-        item_quantity (float): Quantity of the ingredient to be purchased.
-        item_total_price (float): Total price for the quantity of the ingredient.
+        item_quantity (decimal): Quantity of the ingredient to be purchased.
+        item_total_price (decimal): Total price for the quantity of the ingredient.
 
 
     """
 
-    item_id = AutoField(primary_key=True)
-    item_ingredient_id = ForeignKeyField(
-        IngredientModel, backref="shop_list_items", on_delete="CASCADE"
-    )
-    item_quantity = DecimalField(max_digits=10, decimal_places=2)
-    item_total_price = DecimalField(max_digits=10, decimal_places=2)
-
-    class Meta:
-        """
-        Meta:
-        table_name (str): The name of the table ("shop_list_items").
-        """
-        database = database
-        table_name = "shop_list_items"
+    __tablename__ = "shop_list_items"
+    item_id: Mapped[int] = mapped_column(primary_key=True)
+    item_ingredient_id: Mapped[int] = mapped_column(ForeignKey("ingredients.ingredient_id"))
+    item_quantity: Mapped[Decimal] = mapped_column(ScaledInteger(3))
+    item_total_price: Mapped[Decimal] = mapped_column(ScaledInteger(2))
 
 
-class PantriesIngredientModel(Model):
+class PantriesIngredientModel(BulkCreateMixin, Base):
     """
     Represents an ingredient stored in a user's pantry.
 
     Attributes:
         pantries_ingredients_id (int): Primary key for the pantry ingredient entry.
         ingredient_id (int): Foreign key to the ingredient.
-        pantry_ingredient_quantity (float): Quantity of the ingredient in the pantry.
-        pantry_ingredient_expiration_date (date): Expiration date of the ingredient.
+        pantry_ingredient_quantity (decimal): Quantity of the ingredient in the pantry.
+        pantry_ingredient_expiration_date (datetime): Expiration date of the ingredient.
         user_id (int): Foreign key to the user who owns the pantry.
+        user (UserModel): The user who owns the pantry.
 
-
+    The composite index on user_id and the expiration date serves the
+    "ingredients of a user about to expire" lookups directly from the index.
     """
 
-    pantries_ingredients_id = AutoField(primary_key=True)
-    ingredient_id = ForeignKeyField(
-        IngredientModel, backref="pantries", on_delete="CASCADE"
-    )
-    pantry_ingredient_quantity = DecimalField(max_digits=10, decimal_places=2)
-    pantry_ingredient_expiration_date = DateField()
-    user_id = ForeignKeyField(
-        UserModel, backref="pantries_ingredients", on_delete="CASCADE"
+    __tablename__ = "pantries_ingredients"
+    __table_args__ = (
+        Index(
+            "ix_pantries_ingredients_user_id_expiration",
+            "user_id",
+            "pantry_ingredient_expiration_date",
+        ),
     )
+    pantries_ingredients_id: Mapped[int] = mapped_column(primary_key=True)
+    ingredient_id: Mapped[int] = mapped_column(ForeignKey("ingredients.ingredient_id"))
+    pantry_ingredient_quantity: Mapped[Decimal] = mapped_column(ScaledInteger(3))
+    pantry_ingredient_expiration_date: Mapped[datetime]
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
 
-    class Meta:
-        """
-        Meta:
-        table_name (str): The name of the table ("pantries_ingredients").
-        """
-        database = database
-        table_name = "pantries_ingredients"
+    user: Mapped[UserModel] = relationship(back_populates="pantry_items")
 
 
-class NotificationModel(Model):
+class NotificationModel(BulkCreateMixin, Base):
     """
     Represents a notification sent to a user.
 
@@ -595,25 +807,25 @@ class NotificationModel(Model):
         notification_id (int): Primary key for the notification.
         user_id (int): Foreign key to the user receiving the notification.
         notification_message (str): Content of the notification.
-        notification_type (str): Type of the notification (e.g., 'Purchase Reminder').
+        notification_type (NotificationTypeEnum): Type of the notification
+        (e.g., 'Purchase Reminder').
         notification_created_date (datetime): Timestamp of when the notification was created.
+        user (UserModel): The user receiving the notification.
+
+    The composite index on user_id and the creation date serves the
+    "latest notifications of a user" lookups directly from the index.
     """
 
-    notification_id = AutoField(primary_key=True)
-    user_id = ForeignKeyField(UserModel, backref="notifications", on_delete="CASCADE")
-    notification_message = TextField()
-    notification_type = CharField(
-        choices=[
-            (notification.value, notification.name)
-            for notification in NotificationTypeEnum
-        ]
+    __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_user_id_created", "user_id", "notification_created_date"),
+    )
+    notification_id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    notification_type: Mapped[NotificationTypeEnum] = mapped_column(_NOTIFICATION_TYPE)
+    notification_message: Mapped[str] = mapped_column(Text)
+    notification_created_date: Mapped[datetime | None] = mapped_column(
+        server_default=_CURRENT_TIMESTAMP
     )
-    notification_created_date = DateTimeField(default=datetime.now)
 
-    class Meta:
-        """
-        Meta:
-        table_name (str): The name of the table ("notifications").
-        """
-        database = database
-        table_name = "notifications"
+    user: Mapped[UserModel] = relationship(back_populates="notifications")
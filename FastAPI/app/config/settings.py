@@ -8,9 +8,20 @@ load_dotenv()
 
 DATABASE = {
     "name": os.getenv("MYSQL_DATABASE"),
-    "engine": "peewee.MySQLDatabase",
+    "engine": "mysql+asyncmy",
     "user": os.getenv("MYSQL_USER"),
     "password": os.getenv("MYSQL_PASSWORD"),
     "host": os.getenv("MYSQL_HOST"),
     "port": int(os.getenv("MYSQL_PORT")),
+    # Pool sizing: pool_size + max_overflow must stay below MySQL's max_connections
+    "pool_size": int(os.getenv("MYSQL_POOL_SIZE", "20")),
+    "max_overflow": int(os.getenv("MYSQL_MAX_OVERFLOW", "10")),
+    "pool_timeout": int(os.getenv("MYSQL_POOL_TIMEOUT", "10")),
+    "pool_recycle": int(os.getenv("MYSQL_POOL_RECYCLE", "300")),
+    # Seconds a worker keeps the reference tables cached before reloading them
+    "reference_cache_ttl": int(os.getenv("REFERENCE_CACHE_TTL", "300")),
+    # Logging: echo shows every statement with its compiled-cache status
+    # ("cached since ...s ago"), echo_pool the pool checkouts and returns
+    "echo": os.getenv("MYSQL_ECHO", "false").lower() == "true",
+    "echo_pool": os.getenv("MYSQL_ECHO_POOL", "false").lower() == "true",
 }
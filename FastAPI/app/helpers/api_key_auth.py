@@ -1,17 +1,28 @@
 """ API Key Authentication """
+import hmac
 import os
+from functools import cache
 from dotenv import load_dotenv
 from fastapi import HTTPException, Security, status
 from fastapi.security.api_key import APIKeyHeader
 
-load_dotenv()
-
-API_KEY = os.getenv("API_KEY")
 API_KEY_NAME = "x-api-key"
 
 api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=False)
 
 
+@cache
+def configured_api_key() -> bytes:
+    """
+    Get the configured API Key, read from the environment on the first call
+
+    Returns:
+    bytes: The encoded API Key, empty if API_KEY is not set
+    """
+    load_dotenv()
+    return (os.getenv("API_KEY") or "").encode("utf-8")
+
+
 async def get_api_key(api_key: str = Security(api_key_header)):
     """
     Get API Key
@@ -25,8 +36,12 @@ async def get_api_key(api_key: str = Security(api_key_header)):
     Raises:
     HTTPException: An HTTP Exception if the API Key is not valid
     """
-    if api_key == API_KEY:
-        return api_key
+    # A missing header has nothing to leak, so it skips the comparison;
+    # compare_digest takes the same time whatever prefix matches
+    expected = configured_api_key()
+    if api_key and expected:
+        if hmac.compare_digest(api_key.encode("utf-8"), expected):
+            return api_key
 
     raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
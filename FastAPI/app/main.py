@@ -1,10 +1,13 @@
 """ Main module of the FastAPI application """
+import os
+import sys
 from contextlib import asynccontextmanager
 from starlette.responses import RedirectResponse
-from helpers.api_key_auth import get_api_key
-from config.database import database as connection
+from helpers.api_key_auth import configured_api_key, get_api_key
+from config.database import build_engine, build_session_factory
 from routes.user_route import user_route
 from fastapi import FastAPI, Depends
+from fastapi.responses import ORJSONResponse
 
 
 @asynccontextmanager
@@ -15,28 +18,51 @@ async def lifespan(_app: FastAPI):
     Parameters:
     app (FastAPI): The FastAPI application
     """
-    # Conectar a la base de datos si la conexión está cerrada
-    if connection.is_closed():
-        connection.connect()
+    # Fallar al arrancar si no hay API Key, en lugar de rechazar cada petición
+    if not configured_api_key():
+        raise RuntimeError("API_KEY not set")
+    # Crear el engine en cada worker, después del fork, y guardarlo en el estado de la app
+    engine = build_engine()
+    _app.state.engine = engine
+    _app.state.session_factory = build_session_factory(engine)
     try:
         yield  # Aquí es donde se ejecutará la aplicación
     finally:
-        # Cerrar la conexión cuando la aplicación se detenga
-        if not connection.is_closed():
-            connection.close()
+        # Cerrar las conexiones del pool cuando la aplicación se detenga
+        await engine.dispose()
 
-app = FastAPI(lifespan=lifespan)
+# orjson serializa las respuestas en Rust en lugar del módulo json de Python
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# Respuesta creada una sola vez; permanente y cacheable para que el navegador no vuelva a pedir "/"
+_ROOT_REDIRECT = RedirectResponse(
+    url="/docs", status_code=308, headers={"Cache-Control": "public, max-age=86400"}
+)
 
 @app.get("/", include_in_schema=False)
-def read_root():
+async def read_root():
     """
     Redirect to the API documentation
     
     Returns:
-    RedirectResponse: A redirect response to the API documentation
+    RedirectResponse: A permanent redirect response to the API documentation
     """
-    return RedirectResponse(url="/docs")
+    return _ROOT_REDIRECT
 
 
 app.include_router(user_route, prefix="/api", tags=["users"],
                    dependencies=[Depends(get_api_key)])
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop (libuv event loop) y httptools (parser HTTP en C); uvloop no existe en Windows
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))),
+    )
@@ -1,38 +1,80 @@
 """
 user.py
 
-This module defines the User model using Pydantic's BaseModel.
+This module defines the User models using Pydantic's BaseModel.
 
 Classes:
-    User (BaseModel): Represents a user entity.
+    User (BaseModel): Represents the user data sent by the client.
+    UserCreated (BaseModel): Represents the user data returned once it is created.
+    UserOut (UserCreated): Represents the stored user data returned to the client.
 
 Attributes:
     Datetime: The datetime module supplies classes for manipulating dates and times.
     BaseModel (class): Pydantic's base class for creating data models.
+    ConfigDict (class): Holds the validation settings of a model.
+    EmailStr (type): A string validated as an email address.
+    Field (function): Declares the validation constraints of a model field.
+    StringConstraints (class): Declares the constraints of a string field.
 """
 
 from datetime import datetime
-from pydantic import BaseModel
+from typing import Annotated
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints
 
 
 class User(BaseModel):
     """
-    User model representing a user entity.
+    User model representing the data a client sends to create or update a user.
+
+    The id and the timestamps are assigned by the database, so they are not
+    part of the request body.
+
+    Attributes:
+        username (str): The user's username, up to 32 characters, without
+        surrounding whitespace.
+        user_email (str): The user's email.
+        user_password (str): The user's password.
+        user_pfp (str): The user's profile picture. This field is optional.
+    """
+
+    # Only the username is stripped; the password is stored exactly as sent
+    username: Annotated[str, StringConstraints(strip_whitespace=True, max_length=32)]
+    user_email: EmailStr = Field(max_length=100)
+    user_password: str
+    user_pfp: str | None = None
+
+
+class UserCreated(BaseModel):
+    """
+    User model representing the user data returned by the API after creating it.
+
+    It has no password field, so the password can never reach a response. The
+    timestamps are set by MySQL and the insert does not read them back, so
+    they are not part of it.
 
     Attributes:
         id (int): Unique identifier for the user.
         username (str): The user's username.
         user_email (str): The user's email.
-        user_password (str): The user's password.
         user_pfp (str): The user's profile picture.
-        user_created (datetime): The date and time the user was created.
-        user_updated (datetime): The date and time the user was last updated.
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     username: str
     user_email: str
-    user_password: str
-    user_pfp: str
+    user_pfp: str | None = None
+
+
+class UserOut(UserCreated):
+    """
+    User model representing the stored user data returned by the API.
+
+    Attributes:
+        user_created (datetime): The date and time the user was created.
+        user_updated (datetime): The date and time the user was last updated.
+    """
+
     user_created: datetime
     user_updated: datetime
@@ -0,0 +1,112 @@
+""" This module contains the eager-loading queries for recipes and menus """
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, selectinload
+from config.database import (
+    IngredientModel,
+    MenuModel,
+    MenuRecipeModel,
+    RecipeIngredientModel,
+    RecipeModel,
+)
+
+# Each selectinload issues one "WHERE ... IN (...)" query for the whole level,
+# so a menu with K recipes and M ingredients per recipe costs a fixed number
+# of round trips instead of 1 + K + K * M.
+# The TEXT columns (the ingredient description and the recipe description and
+# instructions) are not needed to list recipes with their ingredients, so they
+# are left out of those queries; raiseload turns an access into an error
+# instead of a lazy load the async session cannot run.
+_RECIPE_TEXT_OPTIONS = (
+    defer(RecipeModel.recipe_description, raiseload=True),
+    defer(RecipeModel.recipe_instructions, raiseload=True),
+)
+_RECIPE_INGREDIENTS = selectinload(RecipeModel.ingredients)
+_RECIPE_INGREDIENTS_OPTIONS = (
+    _RECIPE_INGREDIENTS.selectinload(RecipeIngredientModel.ingredient).defer(
+        IngredientModel.ingredient_description, raiseload=True
+    ),
+    _RECIPE_INGREDIENTS.selectinload(RecipeIngredientModel.measurement_unit),
+)
+
+# The statements are built once so every call reuses their compiled SQL;
+# the ids are supplied as bound parameters at execution time.
+_SELECT_RECIPES_WITH_INGREDIENTS = (
+    select(RecipeModel)
+    .where(RecipeModel.user_id == bindparam("user_id"))
+    .options(*_RECIPE_TEXT_OPTIONS, *_RECIPE_INGREDIENTS_OPTIONS)
+)
+
+_MENU_RECIPES = selectinload(MenuModel.recipes).selectinload(MenuRecipeModel.recipe)
+_MENU_RECIPE_INGREDIENTS = _MENU_RECIPES.selectinload(RecipeModel.ingredients)
+_SELECT_MENU_WITH_RECIPES = (
+    select(MenuModel)
+    .where(MenuModel.menu_id == bindparam("menu_id"))
+    .options(
+        _MENU_RECIPES.options(*_RECIPE_TEXT_OPTIONS),
+        _MENU_RECIPE_INGREDIENTS.selectinload(RecipeIngredientModel.ingredient).defer(
+            IngredientModel.ingredient_description, raiseload=True
+        ),
+        _MENU_RECIPE_INGREDIENTS.selectinload(RecipeIngredientModel.measurement_unit),
+    )
+)
+
+# Listing recipes only needs the summary columns, so the TEXT description and
+# instructions are not fetched at all.
+_SELECT_RECIPE_LIST = select(
+    RecipeModel.recipe_id,
+    RecipeModel.recipe_name,
+    RecipeModel.user_id,
+    RecipeModel.recipe_prepare_time,
+    RecipeModel.recipe_difficulty,
+    RecipeModel.recipe_portions,
+    RecipeModel.recipe_is_public,
+).where(RecipeModel.user_id == bindparam("user_id"))
+
+
+class RecipeRepository:
+    """
+    A repository class that loads recipes and menus together with their children
+    """
+
+    async def recipe_list(self, session: AsyncSession, user_id: int):
+        """
+        Get the summary of the recipes of a user
+
+        Args:
+            session (AsyncSession): The database session
+            user_id (int): The id of the user who owns the recipes
+
+        Returns:
+            List: The summary columns of each recipe
+        """
+        recipes = await session.execute(_SELECT_RECIPE_LIST, {"user_id": user_id})
+        return [dict(recipe) for recipe in recipes.mappings()]
+
+    async def recipes_with_ingredients(self, session: AsyncSession, user_id: int):
+        """
+        Get the recipes of a user with their ingredients and measurement units
+
+        Args:
+            session (AsyncSession): The database session
+            user_id (int): The id of the user who owns the recipes
+
+        Returns:
+            List: The recipes with their ingredients loaded
+        """
+        recipes = await session.scalars(_SELECT_RECIPES_WITH_INGREDIENTS, {"user_id": user_id})
+        return list(recipes)
+
+    async def menu_with_recipes(self, session: AsyncSession, menu_id: int):
+        """
+        Get a menu with its recipes and their ingredients
+
+        Args:
+            session (AsyncSession): The database session
+            menu_id (int): The id of the menu to retrieve
+
+        Returns:
+            MenuModel: The menu with its recipes loaded, or None if it does not exist
+        """
+        return await session.scalar(_SELECT_MENU_WITH_RECIPES, {"menu_id": menu_id})
@@ -0,0 +1,97 @@
+""" This module contains the cached lookups for the reference data tables """
+
+import time
+from types import MappingProxyType
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.database import CategoryModel, FoodTypeModel, MeasurementUnitModel
+from config.settings import DATABASE
+
+# Measurement units, categories and food types are small, read-mostly tables,
+# so each one is loaded whole on first use and kept in process memory as plain
+# rows (no ORM instances, which belong to the session that loaded them).
+# cache_clear only reaches the worker that wrote, so every entry also expires
+# after the TTL and the other workers catch up on their next lookup. The rows
+# are read-only views, so a caller cannot change what the next one is served.
+_CACHE: dict[type, tuple[float, MappingProxyType]] = {}
+
+
+async def _rows(session: AsyncSession, model) -> MappingProxyType:
+    """
+    Get the cached rows of a reference table, loading the table on first use
+    and again once the cached copy is older than the TTL
+
+    Args:
+        session (AsyncSession): The database session
+        model (type): The model of the reference table
+
+    Returns:
+        Mapping: The read-only rows of the table keyed by their primary key
+    """
+    cached = _CACHE.get(model)
+    if cached is not None and time.monotonic() - cached[0] < DATABASE["reference_cache_ttl"]:
+        return cached[1]
+    primary_key = model.__table__.primary_key.columns[0].key
+    result = await session.execute(model.select_rows())
+    rows = MappingProxyType(
+        {row[primary_key]: MappingProxyType(dict(row)) for row in result.mappings()}
+    )
+    _CACHE[model] = (time.monotonic(), rows)
+    return rows
+
+
+class ReferenceRepository:
+    """
+    A repository class that serves the reference data from a process-local cache
+    """
+
+    async def get_unit(self, session: AsyncSession, unit_id: int):
+        """
+        Get a measurement unit
+
+        Args:
+            session (AsyncSession): The database session
+            unit_id (int): The id of the measurement unit to retrieve
+
+        Returns:
+            Mapping: The read-only measurement unit data, or None if it does not exist
+        """
+        return (await _rows(session, MeasurementUnitModel)).get(unit_id)
+
+    async def get_category(self, session: AsyncSession, category_id: int):
+        """
+        Get a category
+
+        Args:
+            session (AsyncSession): The database session
+            category_id (int): The id of the category to retrieve
+
+        Returns:
+            Mapping: The read-only category data, or None if it does not exist
+        """
+        return (await _rows(session, CategoryModel)).get(category_id)
+
+    async def get_food_type(self, session: AsyncSession, food_type_id: int):
+        """
+        Get a food type
+
+        Args:
+            session (AsyncSession): The database session
+            food_type_id (int): The id of the food type to retrieve
+
+        Returns:
+            Mapping: The read-only food type data, or None if it does not exist
+        """
+        return (await _rows(session, FoodTypeModel)).get(food_type_id)
+
+    def cache_clear(self, model=None):
+        """
+        Drop the cached rows so the next lookup reloads them; write operations
+        on the reference tables must call it after committing
+
+        Args:
+            model (type): The model whose rows to drop, or None to drop them all
+        """
+        if model is None:
+            _CACHE.clear()
+        else:
+            _CACHE.pop(model, None)
@@ -1,70 +1,84 @@
 """ This module contains the routes for the user service. """
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.database import get_session
 from services.user_service import UserService
-from models.user import User
-from fastapi import APIRouter, Body
+from models.user import User, UserCreated, UserOut
+from fastapi import APIRouter, Body, Depends, Query
 
 user_route = APIRouter()
 user_service = UserService()
 
-@user_route.get("/users/")
-def get_users():
+@user_route.get("/users/", response_model=list[UserOut])
+async def get_users(
+    limit: int = Query(50, ge=1, le=100),
+    after_id: int = Query(0, ge=0),
+    session: AsyncSession = Depends(get_session),
+):
     """
-    Get all users
-    
+    Get a page of users
+
+    Args:
+        limit (int): The maximum number of users to return
+        after_id (int): The id of the last user of the previous page
+
     Returns:
-        List: A list of all users
+        List: The users with an id greater than after_id
     """
-    return user_service.get_users()
+    return await user_service.get_users(session, limit, after_id)
 
-@user_route.get("/users/{user_id}")
-def get_user(user_id: int):
+@user_route.get("/users/{user_id}", response_model=UserOut)
+async def get_user(user_id: int, session: AsyncSession = Depends(get_session)):
     """
     Get a single user
-    
+
     Args:
         user_id (int): The id of the user to retrieve
-        
+
     Returns:
         Dict: The user data
     """
-    return user_service.get_user(user_id)
+    return await user_service.get_user(session, user_id)
 
-@user_route.post("/users")
-def create_user(user: User):
+@user_route.post("/users", response_model=UserCreated)
+async def create_user(user: User, session: AsyncSession = Depends(get_session)):
     """
     Create a new user
-    
+
     Args:
         user (User): The user data to create
-        
+
     Returns:
         Dict: The user data
     """
-    return user_service.create_user(user)
+    return await user_service.create_user(session, user)
 
 @user_route.put("/users/{user_id}")
-def update_user(user_id: int, user_data: User = Body(...)):
+async def update_user(
+    user_id: int,
+    user_data: User = Body(...),
+    session: AsyncSession = Depends(get_session),
+):
     """
     Update a user
-    
+
     Args:
         user_id (int): The id of the user to update
         user_data (dict): The data to update
-        
+
     Returns:
         Dict: The user data
     """
-    return user_service.update_user(user_id, user_data)
+    return await user_service.update_user(session, user_id, user_data)
 
 @user_route.delete("/users/{user_id}")
-def delete_user(user_id: int):
+async def delete_user(user_id: int, session: AsyncSession = Depends(get_session)):
     """
     Delete a user
-    
+
     Args:
         user_id (int): The id of the user to delete
-        
+
     Returns:
         Dict: The user data
     """
-    return user_service.delete_user(user_id)
+    return await user_service.delete_user(session, user_id)
@@ -1,111 +1,193 @@
 """ This module contains the CRUD operations for the user model """
 
-from datetime import datetime
-from peewee import DoesNotExist
+import re
+from asyncmy.constants import ER
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from config.database import UserModel
 from models.user import User
 from fastapi import Body, HTTPException
 
+# Built once so every call reuses the memoized cache key and compiled SQL;
+# the values are supplied as bound parameters at execution time.
+# The columns a client may see: never the password
+_USER_COLUMNS = (
+    UserModel.id,
+    UserModel.username,
+    UserModel.user_email,
+    UserModel.user_pfp,
+    UserModel.user_created,
+    UserModel.user_updated,
+)
+# Keyset pagination: one page past the last id seen
+_SELECT_USERS = (
+    select(*_USER_COLUMNS)
+    .where(UserModel.id > bindparam("after_id"))
+    .order_by(UserModel.id)
+    .limit(bindparam("limit"))
+)
+_SELECT_USER = select(*_USER_COLUMNS).where(UserModel.id == bindparam("user_id"))
+# The unique indexes on user_email and username reject duplicates within the
+# INSERT itself, with no separate lookup round trip and no race between them
+_INSERT_USER = insert(UserModel.__table__)
+# The SET clause is taken from the column keys of the parameters; user_updated
+# is left to the column's ON UPDATE CURRENT_TIMESTAMP
+_UPDATE_USER = update(UserModel.__table__).where(UserModel.id == bindparam("user_id"))
+_DELETE_USER = delete(UserModel.__table__).where(UserModel.id == bindparam("user_id"))
+
+
+# Unique index of the users table -> message for the client. MySQL 8 names the
+# key as table.index, older servers as the bare index name.
+_DUPLICATE_KEY_MESSAGES = {
+    "user_email": "The email address is alredy in use.",
+    "ix_users_username": "The username is already in use.",
+}
+# Anchored at the end: the duplicated value, quoted earlier, is user input
+_DUPLICATE_KEY_NAME = re.compile(r"for key '([^']*)'$")
+
+
+def _duplicate_user_error(exc: IntegrityError) -> HTTPException | None:
+    """
+    Get the response for a duplicated email or username
+
+    Args:
+        exc (IntegrityError): The error raised by the INSERT or UPDATE
+
+    Returns:
+        HTTPException: The 400 response, or None if the error is not a
+        duplicate of one of the unique user columns
+    """
+    args = exc.orig.args
+    if len(args) < 2 or args[0] != ER.DUP_ENTRY:
+        return None
+    key = _DUPLICATE_KEY_NAME.search(str(args[1]))
+    detail = key and _DUPLICATE_KEY_MESSAGES.get(key.group(1).rpartition(".")[2])
+    if not detail:
+        return None
+    return HTTPException(status_code=400, detail=detail)
+
 
 class UserService:
     """
     A service class for the user model
     """
 
-    def get_users(self):
+    async def get_users(self, session: AsyncSession, limit: int = 50, after_id: int = 0):
         """
-        Get all users
+        Get a page of users
+
+        Args:
+            session (AsyncSession): The database session
+            limit (int): The maximum number of users to return
+            after_id (int): The id of the last user of the previous page
 
         Returns:
-            List: A list of all users
+            List: The users with an id greater than after_id, ordered by id
         """
-        users = UserModel.select().where(UserModel.id > 0).dicts()
-        return list(users)
+        users = await session.execute(_SELECT_USERS, {"after_id": after_id, "limit": limit})
+        return [dict(user) for user in users.mappings()]
 
-    def get_user(self, user_id: int):
+    async def get_user(self, session: AsyncSession, user_id: int):
         """
         Get a single user
 
         Args:
 
+            session (AsyncSession): The database session
             user_id (int): The id of the user to retrieve
 
         Returns:
-            Dict: The user data
+            Dict: The user data, without the password
+
+        Raises:
+            HTTPException: If the user does not exist
         """
-        try:
-            user = UserModel.get(UserModel.id == user_id)
-            return user.__data__
-        except DoesNotExist:
-            return {"error": "User not found"}
+        user = await session.execute(_SELECT_USER, {"user_id": user_id})
+        row = user.mappings().first()
+        if row is None:
+            raise HTTPException(status_code=404, detail="User not found.")
+        return dict(row)
 
-    def create_user(self, user: User = Body(...)):
+    async def create_user(self, session: AsyncSession, user: User = Body(...)):
         """
         Create a new user
 
         Args:
+            session (AsyncSession): The database session
             user (User): The user data to create
 
         Returns:
             Dict: The user data
         """
-        existing_user = UserModel.get_or_none(UserModel.user_email == user.user_email)
-        if existing_user:
-            raise HTTPException(
-                status_code=400, detail="The email address is alredy in use."
-            )
-        new_user = UserModel.create(
-            username=user.username,
-            user_email=user.user_email,
-            user_password=user.user_password,
-            user_pfp=user.user_pfp,
-            user_created=datetime.now(),
-            user_updated=datetime.now(),
-        )
-        return new_user.__data__
-
-    def update_user(self, user_id: int, user: User):
+        new_user = {
+            "username": user.username,
+            "user_email": user.user_email,
+            "user_password": user.user_password,
+            "user_pfp": user.user_pfp,
+        }
+        try:
+            result = await session.execute(_INSERT_USER, new_user)
+            await session.commit()
+        except IntegrityError as exc:
+            await session.rollback()
+            error = _duplicate_user_error(exc)
+            if error is None:
+                raise
+            raise error from exc
+        # MySQL fills in the timestamps, so only the sent values are known here
+        del new_user["user_password"]
+        return {"id": result.inserted_primary_key[0], **new_user}
+
+    async def update_user(self, session: AsyncSession, user_id: int, user: User):
         """
         Update a user
 
         Args:
+            session (AsyncSession): The database session
             user_id (int): The id of the user to update
             user (User): The user data to update
 
         Returns:
-            Dict: The updated user data
+            Dict: A message and the id of the updated user
         """
-        existing_user = UserModel.get_by_id(user_id)
-
-        if not existing_user:
+        try:
+            result = await session.execute(
+                _UPDATE_USER,
+                {
+                    "user_id": user_id,
+                    "username": user.username,
+                    "user_email": user.user_email,
+                    "user_password": user.user_password,
+                    "user_pfp": user.user_pfp,
+                },
+            )
+            await session.commit()
+        except IntegrityError as exc:
+            await session.rollback()
+            error = _duplicate_user_error(exc)
+            if error is None:
+                raise
+            raise error from exc
+
+        # rowcount counts the matched rows, so an unchanged user is still found
+        if result.rowcount == 0:
             raise HTTPException(status_code=404, detail="User not found.")
+        return {"message": "User successfully updated", "id": user_id}
 
-        existing_user.username = user.username
-        existing_user.user_email = user.user_email
-        existing_user.user_password = user.user_password
-        existing_user.user_pfp = user.user_pfp
-        existing_user.user_created = user.user_created
-        existing_user.user_updated = datetime.now()
-
-        existing_user.save()
-        return {
-            "message": "User successfully updated",
-            "user_data": existing_user
-        }
-
-    def delete_user(self, user_id: int):
+    async def delete_user(self, session: AsyncSession, user_id: int):
         """
         Delete a user
 
         Args:
+            session (AsyncSession): The database session
             user_id (int): The id of the user to delete
 
         Returns:
             Dict: A message indicating the operation result
         """
-        try:
-            user = UserModel.get(UserModel.id == user_id)
-            user.delete_instance()
-            return {"message": "User deleted successfully"}
-        except DoesNotExist:
+        result = await session.execute(_DELETE_USER, {"user_id": user_id})
+        await session.commit()
+        if result.rowcount == 0:
             return {"error": "User not found"}
+        return {"message": "User deleted successfully"}